@@ -1,18 +1,37 @@
+import os
+import re
+import time
+import heapq
 import sys
-import json
-import glob
+import mmap
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+
+# orjson parses JSON in C, several times faster than stdlib json
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 from PyQt6.QtWidgets import (
-    QApplication, QMainWindow, QTableWidget, QTableWidgetItem,
+    QApplication, QMainWindow,
     QVBoxLayout, QWidget, QHeaderView, QLineEdit, QLabel,
     QHBoxLayout, QComboBox, QPushButton, QTabWidget, QTextEdit,
     QSplitter, QTreeWidget, QTreeWidgetItem, QGroupBox, QFrame,
     QScrollArea, QGridLayout, QListWidget, QListWidgetItem, QMessageBox,
-    QTreeWidgetItemIterator, QAbstractItemView
+    QAbstractItemView, QTableView, QTreeView
 )
-from PyQt6.QtCore import Qt, QTimer, QSize, pyqtSignal, QObject
-from PyQt6.QtGui import QColor, QFont, QPalette, QIcon, QBrush, QCursor
-from collections import defaultdict
+from PyQt6.QtCore import (
+    Qt, QTimer, QSize, pyqtSignal, QObject, QAbstractTableModel, QModelIndex,
+    QEvent, QRunnable, QThreadPool, QSortFilterProxyModel, QRegularExpression
+)
+from PyQt6.QtGui import (
+    QColor, QFont, QPalette, QIcon, QBrush, QCursor,
+    QStandardItemModel, QStandardItem
+)
+from array import array
+from collections import defaultdict, deque, Counter
 
 # Try to import charts
 try:
@@ -25,6 +44,493 @@ except ImportError:
     CHARTS_AVAILABLE = False
 
 
+# Application-wide stylesheet, applied once on the main window. Widgets are
+# matched by class or objectName so individual widgets never carry (and Qt
+# never re-parses) their own copy of these rules.
+APP_QSS = """
+    QMainWindow {
+        background-color: #f5f6fa;
+    }
+    QLabel {
+        color: #2c3e50;
+    }
+    QLineEdit {
+        padding: 8px;
+        border: 2px solid #bdc3c7;
+        border-radius: 5px;
+        background-color: white;
+        font-size: 12px;
+    }
+    QLineEdit:focus {
+        border: 2px solid #3498db;
+    }
+    QPushButton {
+        background-color: #3498db;
+        color: white;
+        border: none;
+        padding: 8px 15px;
+        border-radius: 5px;
+        font-weight: bold;
+        font-size: 12px;
+    }
+    QPushButton:hover {
+        background-color: #2980b9;
+    }
+    QPushButton:pressed {
+        background-color: #21618c;
+    }
+    QComboBox {
+        padding: 5px;
+        border: 2px solid #bdc3c7;
+        border-radius: 5px;
+        background-color: white;
+    }
+    QTableView {
+        background-color: white;
+        alternate-background-color: #f8f9fa;
+        gridline-color: #ecf0f1;
+        border: none;
+    }
+    QHeaderView::section {
+        background-color: #34495e;
+        color: white;
+        padding: 8px;
+        border: none;
+        font-weight: bold;
+    }
+    QTreeWidget {
+        background-color: white;
+        border: 1px solid #ddd;
+        border-radius: 5px;
+    }
+    QTreeWidget::item:hover {
+        background-color: #e8f4f8;
+    }
+    QTreeWidget::item:selected {
+        background-color: #3498db;
+        color: white;
+    }
+    QStatusBar {
+        background-color: #ecf0f1;
+        color: #2c3e50;
+        font-weight: bold;
+    }
+    QTabWidget::pane {
+        border: 1px solid #cccccc;
+        background-color: #f5f6fa;
+    }
+    QTabBar::tab {
+        background-color: #ecf0f1;
+        padding: 10px 20px;
+        margin: 2px;
+        border-top-left-radius: 5px;
+        border-top-right-radius: 5px;
+        font-weight: bold;
+    }
+    QTabBar::tab:selected {
+        background-color: #3498db;
+        color: white;
+    }
+    QTabBar::tab:hover {
+        background-color: #5dade2;
+        color: white;
+    }
+    QLabel#breadcrumb {
+        background-color: #34495e;
+        color: white;
+        padding: 10px;
+        font-size: 13px;
+        font-weight: bold;
+    }
+    QLabel#tabHeader {
+        font-size: 20px;
+        font-weight: bold;
+        margin-bottom: 10px;
+    }
+    QLabel#countLabel {
+        font-weight: bold;
+        margin: 5px;
+    }
+    QLabel#paneLabel {
+        font-weight: bold;
+        font-size: 11px;
+        margin-bottom: 2px;
+    }
+    QFrame#filterFrame {
+        background-color: white;
+        border-radius: 8px;
+        padding: 10px;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #bdc3c7;
+        border-radius: 8px;
+        margin-top: 10px;
+        padding-top: 10px;
+        background-color: white;
+    }
+    QGroupBox#threatGroup {
+        border-color: #e74c3c;
+        background-color: #fff5f5;
+    }
+    QGroupBox#externalGroup {
+        border-color: #f39c12;
+        background-color: #fffbf0;
+    }
+    QTextEdit#intelDetails {
+        background-color: #2c3e50;
+        color: #ecf0f1;
+        font-family: 'Courier New';
+        font-size: 11px;
+        border-radius: 5px;
+        padding: 10px;
+    }
+    QListWidget {
+        border: none;
+    }
+    ClickableConnectionCard {
+        background-color: white;
+        border-radius: 8px;
+        border: 2px solid #ddd;
+        padding: 10px;
+    }
+    ClickableConnectionCard:hover {
+        border: 3px solid #3498db;
+        background-color: #e8f4f8;
+    }
+    QLabel[badge="estab"] {
+        background-color: #27ae60;
+        color: white;
+        padding: 3px 8px;
+        border-radius: 10px;
+        font-size: 10px;
+    }
+    QLabel[badge="listen"] {
+        background-color: #3498db;
+        color: white;
+        padding: 3px 8px;
+        border-radius: 10px;
+        font-size: 10px;
+    }
+    QLabel#connHint {
+        color: #bdc3c7;
+        font-size: 9px;
+        font-style: italic;
+    }
+    QLabel#cardTitle {
+        color: white;
+        font-size: 12px;
+        font-weight: bold;
+    }
+    QLabel#cardValue {
+        color: white;
+        font-size: 32px;
+        font-weight: bold;
+    }
+    QLabel#cardSubtitle {
+        color: rgba(255,255,255,0.8);
+        font-size: 11px;
+    }
+    QLabel#cardHint {
+        color: rgba(255,255,255,0.6);
+        font-size: 9px;
+        font-style: italic;
+    }
+"""
+
+
+def _search_matcher(query):
+    """Predicate over a row's _search_key for a possibly multi-token query.
+
+    Multi-word queries compile once into an alternation regex so each row
+    costs a single C-level sweep; single tokens keep the plain substring
+    test. Returns None when the query is empty.
+    """
+    query = query.strip()
+    if not query:
+        return None
+    if ' ' in query:
+        return re.compile('|'.join(map(re.escape, query.split()))).search
+    return lambda key: query in key
+
+
+@contextmanager
+def bulk_update(widget):
+    """Suspend repaints and signals while a widget is populated in bulk.
+
+    Qt otherwise recomputes layout and emits change signals on every
+    addItem/addTopLevelItem, which makes large populates quadratic.
+    """
+    widget.setUpdatesEnabled(False)
+    widget.blockSignals(True)
+    try:
+        yield widget
+    finally:
+        widget.blockSignals(False)
+        widget.setUpdatesEnabled(True)
+        widget.update()
+
+
+def _iter_jsonl_lines(mm):
+    """Yield newline-delimited byte slices from a memory-mapped file"""
+    start = 0
+    size = len(mm)
+    while start < size:
+        nl = mm.find(b'\n', start)
+        if nl == -1:
+            yield mm[start:]
+            break
+        yield mm[start:nl]
+        start = nl + 1
+
+
+def _parse_jsonl_batch(lines):
+    """Parse JSONL byte lines, preferring one batch parse over per-line calls.
+
+    Valid lines vastly outnumber malformed ones, so joining them into a
+    single JSON array lets the parser run once over the whole file; the
+    per-line loop with its exception handling only runs as a fallback for
+    files that actually contain bad rows.
+    """
+    lines = [line for line in lines if line.strip()]
+    try:
+        rows = _json.loads(b'[' + b','.join(lines) + b']')
+    except ValueError:
+        rows = []
+        for line in lines:
+            try:
+                rows.append(_json.loads(line))
+            except ValueError:
+                continue
+    return [row for row in rows if isinstance(row, dict)]
+
+
+# Total input size past which multi-file loads fan out to worker processes;
+# below it, process startup costs more than the parse itself
+_PARALLEL_PARSE_THRESHOLD = 5 * 1024 * 1024
+
+
+# Hoisted predicate constants for the external-connection checks: tuple-form
+# startswith is a single C call, and frozenset membership is one hashed probe
+_LOOPBACK_PREFIXES = ('127.', '::1')
+_INVALID_RADDRS = frozenset(('', '0.0.0.0', '::'))
+
+# Shared template for the per-tab headline; only the accent color varies
+HEADER_QSS_TMPL = "font-size: 20px; font-weight: bold; color: %s; margin-bottom: 10px;"
+
+
+# Row fields with few distinct values across a capture; interning them lets
+# every duplicate share a single string object
+_INTERN_KEYS = ('Name', 'Type', 'Status', 'Family', 'Username', 'Laddr', 'Raddr')
+
+
+def _intern_common_fields(rows):
+    """Deduplicate low-cardinality string fields across parsed rows"""
+    intern = sys.intern
+    for row in rows:
+        for key in _INTERN_KEYS:
+            value = row.get(key)
+            if type(value) is str:
+                row[key] = intern(value)
+    return rows
+
+
+def _parse_one_file(file_path):
+    """Parse a single capture file; returns (file_path, kind, rows, error).
+
+    Top-level (not a method) so ProcessPoolExecutor can pickle it.
+    """
+    try:
+        # Memory-map the file: lines are sliced straight out of the
+        # page cache as bytes (orjson accepts bytes directly), so no
+        # text-mode decode and no full-file copy into Python
+        with open(file_path, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                return file_path, None, None, None  # Empty file
+
+        with mm:
+            # Read the first line to detect file type
+            first_line = next((line for line in _iter_jsonl_lines(mm) if line.strip()), None)
+            if first_line is None:
+                return file_path, None, None, None
+
+            try:
+                first_obj = _json.loads(first_line)
+            except ValueError:
+                print(f"Warning: Could not decode first line of {file_path}. Skipping.")
+                return file_path, None, None, None
+
+            if not isinstance(first_obj, dict):
+                print(f"Warning: First line of {file_path} is not a JSON object. Skipping.")
+                return file_path, None, None, None
+
+            # Detect file type once per file, then run a single batch parse
+            if 'Laddr' in first_obj and 'Raddr' in first_obj:  # Likely network data
+                print(f"Processing {file_path} as network data...")
+                kind = 'network'
+                lines = _iter_jsonl_lines(mm)
+            elif 'Ppid' in first_obj and 'CommandLine' in first_obj:  # Likely process data
+                print(f"Processing {file_path} as process data...")
+                # Cheap substring reject before parsing: lines without
+                # the discriminator key can't be process records, and a
+                # bytes scan is far cheaper than a JSON parse
+                kind = 'process'
+                lines = (line for line in _iter_jsonl_lines(mm) if b'"Ppid"' in line)
+            else:
+                print(f"Warning: Could not determine data type for {file_path}. Skipping.")
+                return file_path, None, None, None
+
+            return file_path, kind, _intern_common_fields(_parse_jsonl_batch(lines)), None
+
+    except Exception as e:
+        return file_path, None, None, str(e)
+
+
+def _load_json_files(json_files):
+    """Parse capture files into row lists; safe to run off the UI thread.
+
+    Returns (network_data, process_data, errors) where errors is a list of
+    (file_path, message) pairs for the caller to surface. Large multi-file
+    loads are parsed in parallel worker processes, one file each.
+    """
+    network_data = []
+    process_data = []
+    errors = []
+
+    try:
+        total_size = sum(os.path.getsize(p) for p in json_files)
+    except OSError:
+        total_size = 0
+
+    if len(json_files) > 1 and total_size > _PARALLEL_PARSE_THRESHOLD:
+        workers = min(len(json_files), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_parse_one_file, json_files))
+    else:
+        results = [_parse_one_file(p) for p in json_files]
+
+    for file_path, kind, rows, error in results:
+        if error is not None:
+            errors.append((file_path, error))
+        elif kind == 'network':
+            network_data.extend(rows)
+        elif kind == 'process':
+            process_data.extend(rows)
+
+    return network_data, process_data, errors
+
+
+def _compute_stats(network_data, process_data):
+    """Aggregate every dashboard/filter metric in one pass over the data"""
+    by_status = Counter()
+    by_proto = Counter()
+    by_name = Counter()
+    external = 0
+    unsigned = 0
+    pids_with_net = set()
+    remote_ips = set()
+
+    for n in network_data:
+        status = n.get('Status')
+        if status:
+            by_status[status] += 1
+        proto = n.get('Type')
+        if proto:
+            by_proto[proto] += 1
+        by_name[n.get('Name', 'Unknown')] += 1
+
+        pids_with_net.add(n['_pid_str'])
+
+        raddr = n.get('Raddr', '')
+        if (status == 'ESTAB' and raddr.strip()
+                and not raddr.startswith(_LOOPBACK_PREFIXES)):
+            external += 1
+        if raddr and raddr not in _INVALID_RADDRS:
+            remote_ips.add(raddr)
+
+        auth = n.get('Authenticode')
+        if not auth or auth.get('Trusted') != 'trusted':
+            unsigned += 1
+
+    by_user = Counter()
+    for p in process_data:
+        username = p.get('Username')
+        if username:
+            by_user[username] += 1
+
+    return {
+        'by_status': by_status,
+        'by_proto': by_proto,
+        'by_name': by_name,
+        'by_user': by_user,
+        'external': external,
+        'unsigned': unsigned,
+        'pids_with_net': pids_with_net,
+        'remote_ips': remote_ips,
+    }
+
+
+def _prepare_dataset(network_data, process_data):
+    """Build the derived indexes and aggregates for a parsed dataset.
+
+    Pure-Python preparation that runs on the loader thread, so the main
+    thread only has widget updates left to do.
+    """
+    # Cache stringified PIDs once per row; populate loops and handlers
+    # reuse the interned string instead of re-running str() per access
+    for n in network_data:
+        n['_pid_str'] = sys.intern(str(n.get('Pid', '')))
+        n['_search_key'] = (f"{n.get('Name', '')} {n['_pid_str']} "
+                            f"{n.get('Laddr', '')} {n.get('Raddr', '')}").lower()
+    for p in process_data:
+        p['_pid_str'] = sys.intern(str(p.get('Pid', '')))
+        p['_ppid_str'] = sys.intern(str(p.get('Ppid', '')))
+
+    # Single-pass PID index over the process list
+    process_map = {p['_pid_str']: p for p in process_data}
+
+    # Per-PID connection index: every populate path looks connections up
+    # here in O(1) instead of rescanning network_data per process.
+    # The per-PID status tallies ride along for the timeline columns
+    conns_by_pid = defaultdict(list)
+    pid_status_counts = defaultdict(Counter)
+    for n in network_data:
+        pid = n['_pid_str']
+        conns_by_pid[pid].append(n)
+        pid_status_counts[pid][n.get('Status')] += 1
+
+    return {
+        'network_data': network_data,
+        'process_data': process_data,
+        'process_map': process_map,
+        'conns_by_pid': conns_by_pid,
+        'pid_status_counts': pid_status_counts,
+        'stats': _compute_stats(network_data, process_data),
+    }
+
+
+class LoaderSignals(QObject):
+    """Completion signal for the background file loader"""
+    done = pyqtSignal(object)  # payload dict from _prepare_dataset + errors
+
+
+class LoaderWorker(QRunnable):
+    """Parses and prepares the capture files on a pool thread"""
+
+    def __init__(self, json_files):
+        super().__init__()
+        self.json_files = json_files
+        self.signals = LoaderSignals()
+
+    def run(self):
+        network_data, process_data, errors = _load_json_files(self.json_files)
+        payload = _prepare_dataset(network_data, process_data)
+        payload['errors'] = errors
+        self.signals.done.emit(payload)
+
+
 class DataSignals(QObject):
     """Signals for cross-tab communication"""
     process_selected = pyqtSignal(str)  # PID
@@ -35,6 +541,84 @@ class DataSignals(QObject):
     highlight_untrusted = pyqtSignal()
 
 
+class DictTableModel(QAbstractTableModel):
+    """Table model serving rows of dicts through per-column getters.
+
+    Qt only calls data() for visible cells, so populating a view costs
+    O(visible rows) instead of one QTableWidgetItem per cell.
+    """
+
+    def __init__(self, headers, getters, background=None, foreground=None, parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._getters = getters
+        self._background = background  # optional (row_dict, col) -> QColor
+        self._foreground = foreground  # optional (row_dict, col) -> QColor
+        self._rows = []
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+
+    def set_rows(self, rows):
+        """Swap in a new row list with a single model reset.
+
+        Re-applies the last header sort so a refilter doesn't silently
+        fall back to dataset order while the indicator still shows.
+        """
+        self.beginResetModel()
+        self._rows = rows
+        if self._sort_column >= 0:
+            self._sort_rows()
+        self.endResetModel()
+
+    def row_data(self, row):
+        """Return the underlying dict for a row"""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        # Vertical headers keep Qt's default row numbering
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = self._rows[index.row()]
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._getters[col](row)
+        if role == Qt.ItemDataRole.BackgroundRole and self._background:
+            return self._background(row, col)
+        if role == Qt.ItemDataRole.ForegroundRole and self._foreground:
+            return self._foreground(row, col)
+        return None
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Sort inside a reset so persistent indexes can't go stale"""
+        self._sort_column = column
+        self._sort_order = order
+        self.beginResetModel()
+        self._sort_rows()
+        self.endResetModel()
+
+    def _sort_rows(self):
+        getter = self._getters[self._sort_column]
+        self._rows.sort(
+            key=lambda r: (getter(r) is None, getter(r)),
+            reverse=(self._sort_order == Qt.SortOrder.DescendingOrder)
+        )
+
+
 class ClickableMetricCard(QFrame):
     """Interactive metric card that can be clicked"""
     def __init__(self, title, value, subtitle="", color="#3498db", parent=None):
@@ -60,35 +644,35 @@ class ClickableMetricCard(QFrame):
 
         # Title
         title_label = QLabel(title)
-        title_label.setStyleSheet("color: white; font-size: 12px; font-weight: bold;")
+        title_label.setObjectName("cardTitle")
         layout.addWidget(title_label)
 
         # Value
         self.value_label = QLabel(str(value))
-        self.value_label.setStyleSheet("color: white; font-size: 32px; font-weight: bold;")
+        self.value_label.setObjectName("cardValue")
         layout.addWidget(self.value_label)
 
         # Subtitle
         if subtitle:
             subtitle_label = QLabel(subtitle)
-            subtitle_label.setStyleSheet("color: rgba(255,255,255,0.8); font-size: 11px;")
+            subtitle_label.setObjectName("cardSubtitle")
             layout.addWidget(subtitle_label)
 
         # Click hint
         hint_label = QLabel("🖱️ Click to filter")
-        hint_label.setStyleSheet("color: rgba(255,255,255,0.6); font-size: 9px; font-style: italic;")
+        hint_label.setObjectName("cardHint")
         layout.addWidget(hint_label)
 
         layout.addStretch()
 
-    def darken_color(self, color, factor=0.2):
-        """Darken a hex color"""
-        color = color.lstrip('#')
-        r, g, b = tuple(int(color[i:i+2], 16) for i in (0, 2, 4))
-        r = int(r * (1 - factor))
-        g = int(g * (1 - factor))
-        b = int(b * (1 - factor))
-        return f'#{r:02x}{g:02x}{b:02x}'
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def darken_color(color, factor=0.2):
+        """Darken a hex color (cached: the palette is a handful of colors)"""
+        # bytes.fromhex does the three-slice int() parse in a single C call
+        r, g, b = bytes.fromhex(color.lstrip('#'))
+        k = 1 - factor
+        return '#%02x%02x%02x' % (int(r * k), int(g * k), int(b * k))
 
     def update_value(self, value):
         """Update the card's value"""
@@ -96,7 +680,7 @@ class ClickableMetricCard(QFrame):
 
 
 class ClickableConnectionCard(QFrame):
-    """Clickable connection card"""
+    """Clickable connection card, reusable across different connections"""
     clicked = pyqtSignal(dict)
 
     def __init__(self, connection_data, process_info, parent=None):
@@ -105,74 +689,64 @@ class ClickableConnectionCard(QFrame):
         self.setFrameShape(QFrame.Shape.StyledPanel)
         self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
 
-        self.setStyleSheet("""
-            ClickableConnectionCard {
-                background-color: white;
-                border-radius: 8px;
-                border: 2px solid #ddd;
-                padding: 10px;
-            }
-            ClickableConnectionCard:hover {
-                border: 3px solid #3498db;
-                background-color: #e8f4f8;
-            }
-        """)
-
         layout = QVBoxLayout(self)
         layout.setSpacing(5)
 
-        # Header
+        # One rich-text body instead of four stacked QLabels: a single child
+        # widget that Qt lays out once, with the status badge kept separate
         header_layout = QHBoxLayout()
-        proc_name = QLabel(f"🔷 {connection_data.get('Name', 'Unknown')}")
-        proc_name.setStyleSheet("font-weight: bold; font-size: 14px; color: #2c3e50;")
-        header_layout.addWidget(proc_name)
+        self.body = QLabel()
+        self.body.setTextFormat(Qt.TextFormat.RichText)
+        header_layout.addWidget(self.body, 1)
 
-        # Status badge
-        status = connection_data.get('Status', '')
-        status_badge = QLabel(status)
-        if status == 'ESTAB':
-            status_badge.setStyleSheet("""
-                background-color: #27ae60; color: white;
-                padding: 3px 8px; border-radius: 10px; font-size: 10px;
-            """)
-        elif status == 'LISTEN':
-            status_badge.setStyleSheet("""
-                background-color: #3498db; color: white;
-                padding: 3px 8px; border-radius: 10px; font-size: 10px;
-            """)
-        header_layout.addWidget(status_badge)
-        header_layout.addStretch()
+        self.status_badge = QLabel()
+        header_layout.addWidget(self.status_badge, 0, Qt.AlignmentFlag.AlignTop)
 
         layout.addLayout(header_layout)
 
-        # Connection info
-        conn_type = connection_data.get('Type', 'N/A')
-        local = f"{connection_data.get('Laddr', '')}:{connection_data.get('Lport', '')}"
-        remote = f"{connection_data.get('Raddr', '')}:{connection_data.get('Rport', '')}"
-
-        info_label = QLabel(f"<b>{conn_type}</b> | {local} → {remote}")
-        info_label.setStyleSheet("color: #555; font-size: 11px;")
-        layout.addWidget(info_label)
-
-        # User
-        username = process_info.get('Username', connection_data.get('Username', ''))
-        if username:
-            user_label = QLabel(f"👤 {username}")
-            user_label.setStyleSheet("color: #7f8c8d; font-size: 10px;")
-            layout.addWidget(user_label)
-
-        # PID
-        pid_label = QLabel(f"PID: {connection_data.get('Pid', 'N/A')}")
-        pid_label.setStyleSheet("color: #95a5a6; font-size: 10px;")
-        layout.addWidget(pid_label)
-
         # Click hint
         hint = QLabel("🖱️ Click for details")
-        hint.setStyleSheet("color: #bdc3c7; font-size: 9px; font-style: italic;")
+        hint.setObjectName("connHint")
         layout.addWidget(hint)
 
         self.setMaximumHeight(140)
 
+        self.update_connection(connection_data, process_info)
+
+    def update_connection(self, connection_data, process_info):
+        """Rebind the card to another connection without rebuilding widgets"""
+        self.connection_data = connection_data
+
+        status = connection_data.get('Status', '')
+        self.status_badge.setText(status)
+        # Styling comes from the APP_QSS attribute selectors; only repolish
+        # when the badge class actually changes
+        badge = 'estab' if status == 'ESTAB' else 'listen' if status == 'LISTEN' else 'other'
+        if self.status_badge.property('badge') != badge:
+            self.status_badge.setProperty('badge', badge)
+            style = self.status_badge.style()
+            style.unpolish(self.status_badge)
+            style.polish(self.status_badge)
+
+        conn_type = connection_data.get('Type', 'N/A')
+        local = f"{connection_data.get('Laddr', '')}:{connection_data.get('Lport', '')}"
+        remote = f"{connection_data.get('Raddr', '')}:{connection_data.get('Rport', '')}"
+        username = process_info.get('Username', connection_data.get('Username', ''))
+        user_line = (
+            f"<br><span style='color:#7f8c8d; font-size:10px'>👤 {username}</span>"
+            if username else ""
+        )
+
+        self.body.setText(
+            f"<span style='font-weight:bold; font-size:14px; color:#2c3e50'>"
+            f"🔷 {connection_data.get('Name', 'Unknown')}</span>"
+            f"<br><span style='color:#555; font-size:11px'>"
+            f"<b>{conn_type}</b> | {local} → {remote}</span>"
+            f"{user_line}"
+            f"<br><span style='color:#95a5a6; font-size:10px'>"
+            f"PID: {connection_data.get('Pid', 'N/A')}</span>"
+        )
+
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
             self.clicked.emit(self.connection_data)
@@ -185,7 +759,13 @@ class InteractiveNetworkViewer(QMainWindow):
         self.network_data = []
         self.process_data = []
         self.process_map = {}
+        self.conns_by_pid = {}
+        self.pid_status_counts = {}
+        self._search_trigrams = None
         self.filtered_data = []
+        self._forest_cache = None
+        self._intel_pid_index = {}
+        self._now_epoch = time.time()
 
         # Create signals object for cross-tab communication
         self.signals = DataSignals()
@@ -199,11 +779,10 @@ class InteractiveNetworkViewer(QMainWindow):
         self.signals.highlight_untrusted.connect(self.on_highlight_untrusted)
 
         self.initUI()
-        self.load_data()
         self.apply_theme()
 
-        # Status bar for showing context
-        self.statusBar().showMessage("Ready | Click on any metric, process, or connection to navigate")
+        # Loading runs in the background; the status bar tracks progress
+        self.load_data()
 
     def initUI(self):
         self.setWindowTitle('🔗 Interactive Network & Process Intelligence')
@@ -217,43 +796,20 @@ class InteractiveNetworkViewer(QMainWindow):
 
         # Add breadcrumb navigation
         self.breadcrumb = QLabel("📍 Dashboard")
-        self.breadcrumb.setStyleSheet("""
-            background-color: #34495e;
-            color: white;
-            padding: 10px;
-            font-size: 13px;
-            font-weight: bold;
-        """)
+        self.breadcrumb.setObjectName("breadcrumb")
         layout.addWidget(self.breadcrumb)
 
         # Create tabs
         self.tabs = QTabWidget()
         self.tabs.currentChanged.connect(self.on_tab_changed)
-        self.tabs.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid #cccccc;
-                background-color: #f5f6fa;
-            }
-            QTabBar::tab {
-                background-color: #ecf0f1;
-                padding: 10px 20px;
-                margin: 2px;
-                border-top-left-radius: 5px;
-                border-top-right-radius: 5px;
-                font-weight: bold;
-            }
-            QTabBar::tab:selected {
-                background-color: #3498db;
-                color: white;
-            }
-            QTabBar::tab:hover {
-                background-color: #5dade2;
-                color: white;
-            }
-        """)
 
         layout.addWidget(self.tabs)
 
+        # Debounce timers: collapse keystroke bursts into a single filter pass
+        self._grid_search_timer = self._make_debounce_timer(self.update_network_grid)
+        self._table_search_timer = self._make_debounce_timer(self.apply_table_filters)
+        self._tree_search_timer = self._make_debounce_timer(self._apply_tree_filter)
+
         # Create tabs
         self.create_dashboard_tab()
         self.create_network_grid_tab()
@@ -263,77 +819,17 @@ class InteractiveNetworkViewer(QMainWindow):
         self.create_timeline_view_tab()
         self.create_advanced_table_tab()
 
+    def _make_debounce_timer(self, slot, interval=150):
+        """Single-shot timer so rapid typing runs the filter only once"""
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(interval)
+        timer.timeout.connect(slot)
+        return timer
+
     def apply_theme(self):
-        """Apply modern theme"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f6fa;
-            }
-            QLabel {
-                color: #2c3e50;
-            }
-            QLineEdit {
-                padding: 8px;
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                background-color: white;
-                font-size: 12px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #3498db;
-            }
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 8px 15px;
-                border-radius: 5px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #21618c;
-            }
-            QComboBox {
-                padding: 5px;
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                background-color: white;
-            }
-            QTableWidget {
-                background-color: white;
-                alternate-background-color: #f8f9fa;
-                gridline-color: #ecf0f1;
-                border: none;
-            }
-            QHeaderView::section {
-                background-color: #34495e;
-                color: white;
-                padding: 8px;
-                border: none;
-                font-weight: bold;
-            }
-            QTreeWidget {
-                background-color: white;
-                border: 1px solid #ddd;
-                border-radius: 5px;
-            }
-            QTreeWidget::item:hover {
-                background-color: #e8f4f8;
-            }
-            QTreeWidget::item:selected {
-                background-color: #3498db;
-                color: white;
-            }
-            QStatusBar {
-                background-color: #ecf0f1;
-                color: #2c3e50;
-                font-weight: bold;
-            }
-        """)
+        """Apply modern theme (single stylesheet parsed once by Qt)"""
+        self.setStyleSheet(APP_QSS)
 
     def create_dashboard_tab(self):
         """Executive dashboard"""
@@ -344,7 +840,7 @@ class InteractiveNetworkViewer(QMainWindow):
 
         # Title
         title = QLabel("📊 Network Security Dashboard")
-        title.setStyleSheet("font-size: 24px; font-weight: bold; color: #2c3e50; margin-bottom: 10px;")
+        title.setStyleSheet("font-size: 24px; font-weight: bold; margin-bottom: 10px;")
         layout.addWidget(title)
 
         # Metric cards
@@ -369,20 +865,9 @@ class InteractiveNetworkViewer(QMainWindow):
 
         # Activity feed
         activity_group = QGroupBox("🔔 Recent Network Activity")
-        activity_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #bdc3c7;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: white;
-            }
-        """)
         activity_layout = QVBoxLayout(activity_group)
 
         self.activity_list = QListWidget()
-        self.activity_list.setStyleSheet("border: none;")
         self.activity_list.itemDoubleClicked.connect(self.on_activity_clicked)
         activity_layout.addWidget(self.activity_list)
 
@@ -399,13 +884,13 @@ class InteractiveNetworkViewer(QMainWindow):
 
         # Filters
         filter_frame = QFrame()
-        filter_frame.setStyleSheet("background-color: white; border-radius: 8px; padding: 10px;")
+        filter_frame.setObjectName("filterFrame")
         filter_layout = QHBoxLayout(filter_frame)
 
         filter_layout.addWidget(QLabel("🔍"))
         self.grid_search = QLineEdit()
         self.grid_search.setPlaceholderText("Search connections...")
-        self.grid_search.textChanged.connect(self.update_network_grid)
+        self.grid_search.textChanged.connect(lambda _text: self._grid_search_timer.start())
         filter_layout.addWidget(self.grid_search)
 
         filter_layout.addWidget(QLabel("Protocol:"))
@@ -428,23 +913,30 @@ class InteractiveNetworkViewer(QMainWindow):
 
         # Count
         self.grid_count_label = QLabel("Showing 0 connections")
-        self.grid_count_label.setStyleSheet("font-weight: bold; margin: 5px;")
+        self.grid_count_label.setObjectName("countLabel")
         layout.addWidget(self.grid_count_label)
 
-        # Scroll area
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("border: none; background-color: transparent;")
+        # Scroll area (virtualized: cards exist only for the visible viewport)
+        self.grid_scroll = QScrollArea()
+        self.grid_scroll.setStyleSheet("border: none; background-color: transparent;")
 
         self.grid_container = QWidget()
-        self.grid_layout = QGridLayout(self.grid_container)
-        self.grid_layout.setSpacing(10)
+        self.grid_scroll.setWidget(self.grid_container)
+        layout.addWidget(self.grid_scroll)
 
-        scroll.setWidget(self.grid_container)
-        layout.addWidget(scroll)
+        self._grid_rows = []
+        self._grid_card_pool = []
+        self.grid_scroll.verticalScrollBar().valueChanged.connect(self._layout_visible_cards)
+        self.grid_scroll.viewport().installEventFilter(self)
 
         self.tabs.addTab(grid_tab, "🎯 Network Grid")
 
+    def eventFilter(self, obj, event):
+        # Re-layout the virtualized grid when its viewport is resized
+        if obj is self.grid_scroll.viewport() and event.type() == QEvent.Type.Resize:
+            self._layout_visible_cards()
+        return super().eventFilter(obj, event)
+
     def create_process_intel_tab(self):
         """Process intelligence"""
         intel_tab = QWidget()
@@ -471,7 +963,7 @@ class InteractiveNetworkViewer(QMainWindow):
         tree_layout.setSpacing(3)
 
         tree_label = QLabel("📁 Process Tree (Double-click to navigate)")
-        tree_label.setStyleSheet("font-weight: bold; font-size: 11px; margin-bottom: 2px;")
+        tree_label.setObjectName("paneLabel")
         tree_layout.addWidget(tree_label)
 
         self.intel_tree = QTreeWidget()
@@ -484,6 +976,7 @@ class InteractiveNetworkViewer(QMainWindow):
         self.intel_tree.setMinimumHeight(500)  # Set minimum height
         self.intel_tree.itemClicked.connect(self.on_intel_tree_clicked)
         self.intel_tree.itemDoubleClicked.connect(self.on_intel_tree_double_clicked)
+        self.intel_tree.itemExpanded.connect(self._materialize_children)
         tree_layout.addWidget(self.intel_tree, 1)  # Stretch factor of 1
 
         splitter.addWidget(tree_container)
@@ -496,7 +989,7 @@ class InteractiveNetworkViewer(QMainWindow):
 
         details_header_layout = QHBoxLayout()
         details_label = QLabel("📋 Process Details")
-        details_label.setStyleSheet("font-weight: bold; font-size: 11px; margin-bottom: 2px;")
+        details_label.setObjectName("paneLabel")
         details_header_layout.addWidget(details_label)
         details_header_layout.addStretch()
 
@@ -522,14 +1015,7 @@ class InteractiveNetworkViewer(QMainWindow):
         self.intel_details.setReadOnly(True)
         self.intel_details.setMinimumWidth(500)
         self.intel_details.setMinimumHeight(500)  # Set minimum height
-        self.intel_details.setStyleSheet("""
-            background-color: #2c3e50;
-            color: #ecf0f1;
-            font-family: 'Courier New';
-            font-size: 11px;
-            border-radius: 5px;
-            padding: 10px;
-        """)
+        self.intel_details.setObjectName("intelDetails")
         details_layout.addWidget(self.intel_details, 1)  # Stretch factor of 1
 
         splitter.addWidget(details_container)
@@ -544,32 +1030,29 @@ class InteractiveNetworkViewer(QMainWindow):
 
         self.tabs.addTab(intel_tab, "🧠 Process Intel")
 
-    def create_security_tab(self):
-        """Security analysis"""
-        security_tab = QWidget()
-        layout = QVBoxLayout(security_tab)
+    def _make_tab(self, title, color):
+        """Common tab scaffolding: container widget, layout, styled header"""
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
         layout.setContentsMargins(15, 15, 15, 15)
 
-        header = QLabel("🛡️ Security Analysis & Threat Detection")
-        header.setStyleSheet("font-size: 20px; font-weight: bold; color: #e74c3c; margin-bottom: 10px;")
+        header = QLabel(title)
+        header.setStyleSheet(HEADER_QSS_TMPL % color)
         layout.addWidget(header)
 
+        return tab, layout
+
+    def create_security_tab(self):
+        """Security analysis"""
+        security_tab, layout = self._make_tab("🛡️ Security Analysis & Threat Detection", "#e74c3c")
+
         # Metrics
         self.security_metrics_layout = QHBoxLayout()
         layout.addLayout(self.security_metrics_layout)
 
         # Threat list
         threat_group = QGroupBox("⚠️ Potential Security Indicators (Click items for details)")
-        threat_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #e74c3c;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: #fff5f5;
-            }
-        """)
+        threat_group.setObjectName("threatGroup")
         threat_layout = QVBoxLayout(threat_group)
 
         self.threat_list = QListWidget()
@@ -580,24 +1063,24 @@ class InteractiveNetworkViewer(QMainWindow):
 
         # External connections
         external_group = QGroupBox("🌐 External Connections (Double-click for details)")
-        external_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #f39c12;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: #fffbf0;
-            }
-        """)
+        external_group.setObjectName("externalGroup")
         external_layout = QVBoxLayout(external_group)
 
-        self.external_table = QTableWidget()
-        self.external_table.setColumnCount(6)
-        self.external_table.setHorizontalHeaderLabels([
-            'Process', 'PID', 'Remote IP', 'Remote Port', 'Protocol', 'User'
-        ])
-        self.external_table.cellDoubleClicked.connect(self.on_external_table_clicked)
+        self.external_table = QTableView()
+        self.external_model = DictTableModel(
+            ['Process', 'PID', 'Remote IP', 'Remote Port', 'Protocol', 'User'],
+            [
+                lambda n: n.get('Name', ''),
+                lambda n: n['_pid_str'],
+                lambda n: n.get('Raddr', ''),
+                lambda n: n.get('Rport', 0),
+                lambda n: n.get('Type', ''),
+                lambda n: self.process_map.get(n['_pid_str'], {}).get('Username', ''),
+            ]
+        )
+        self.external_table.setModel(self.external_model)
+        self.external_table.horizontalHeader().setResizeContentsPrecision(100)
+        self.external_table.doubleClicked.connect(self.on_external_table_clicked)
         external_layout.addWidget(self.external_table)
 
         layout.addWidget(external_group)
@@ -606,13 +1089,7 @@ class InteractiveNetworkViewer(QMainWindow):
 
     def create_interactive_tree_tab(self):
         """Interactive process tree"""
-        tree_tab = QWidget()
-        layout = QVBoxLayout(tree_tab)
-        layout.setContentsMargins(15, 15, 15, 15)
-
-        header = QLabel("🌳 Interactive Process Tree")
-        header.setStyleSheet("font-size: 20px; font-weight: bold; color: #27ae60; margin-bottom: 10px;")
-        layout.addWidget(header)
+        tree_tab, layout = self._make_tab("🌳 Interactive Process Tree", "#27ae60")
 
         # Controls
         controls = QHBoxLayout()
@@ -620,7 +1097,7 @@ class InteractiveNetworkViewer(QMainWindow):
         controls.addWidget(QLabel("🔍"))
         self.tree_search = QLineEdit()
         self.tree_search.setPlaceholderText("Search process...")
-        self.tree_search.textChanged.connect(self.filter_tree)
+        self.tree_search.textChanged.connect(lambda _text: self._tree_search_timer.start())
         controls.addWidget(self.tree_search)
 
         expand_btn = QPushButton("Expand All")
@@ -643,37 +1120,63 @@ class InteractiveNetworkViewer(QMainWindow):
         legend.addStretch()
         layout.addLayout(legend)
 
-        # Tree
-        self.process_tree = QTreeWidget()
-        self.process_tree.setHeaderLabels([
+        # Tree: QTreeView over a standard-item model, filtered by a proxy
+        # so per-keystroke matching runs inside Qt rather than Python
+        self.process_tree_model = QStandardItemModel()
+        self.process_tree_model.setHorizontalHeaderLabels([
             'Process (PID)', 'Username', 'Connections', 'Start Time', 'Status'
         ])
+        self.process_tree_proxy = QSortFilterProxyModel(self)
+        self.process_tree_proxy.setSourceModel(self.process_tree_model)
+        self.process_tree_proxy.setRecursiveFilteringEnabled(True)
+        self.process_tree_proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+
+        self.process_tree = QTreeView()
+        self.process_tree.setModel(self.process_tree_proxy)
         self.process_tree.setColumnWidth(0, 400)
         self.process_tree.setAlternatingRowColors(True)
-        self.process_tree.itemDoubleClicked.connect(self.on_tree_double_clicked)
+        self.process_tree.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.process_tree.doubleClicked.connect(self.on_tree_double_clicked)
         layout.addWidget(self.process_tree)
 
         self.tabs.addTab(tree_tab, "🌳 Process Tree")
 
     def create_timeline_view_tab(self):
         """Timeline view"""
-        timeline_tab = QWidget()
-        layout = QVBoxLayout(timeline_tab)
-        layout.setContentsMargins(15, 15, 15, 15)
-
-        header = QLabel("⏱️ Process & Network Timeline")
-        header.setStyleSheet("font-size: 20px; font-weight: bold; color: #9b59b6; margin-bottom: 10px;")
-        layout.addWidget(header)
-
-        self.timeline_table = QTableWidget()
-        self.timeline_table.setColumnCount(9)
-        self.timeline_table.setHorizontalHeaderLabels([
-            'Time', 'Event', 'Process', 'PID', 'User',
-            'Network Conns', 'Listening', 'Established', 'Call Chain'
-        ])
+        timeline_tab, layout = self._make_tab("⏱️ Process & Network Timeline", "#9b59b6")
+
+        def proc_conns(proc):
+            return self.conns_by_pid.get(proc['_pid_str'], ())
+
+        def proc_status(proc, status):
+            counts = self.pid_status_counts.get(proc['_pid_str'])
+            return counts[status] if counts else 0
+
+        def proc_start(proc):
+            return proc.get('StartTime', '')[:19].replace('T', ' ') if proc.get('StartTime') else ''
+
+        self.timeline_table = QTableView()
+        self.timeline_model = DictTableModel(
+            ['Time', 'Event', 'Process', 'PID', 'User',
+             'Network Conns', 'Listening', 'Established', 'Call Chain'],
+            [
+                proc_start,
+                lambda p: "🔷 Process Start",
+                lambda p: p.get('Name', ''),
+                lambda p: p['_pid_str'],
+                lambda p: p.get('Username', ''),
+                lambda p: len(proc_conns(p)),
+                lambda p: proc_status(p, 'LISTEN'),
+                lambda p: proc_status(p, 'ESTAB'),
+                lambda p: p.get('CallChain', ''),
+            ],
+            background=lambda p, col: QColor(255, 244, 179) if col == 5 and proc_conns(p) else None
+        )
+        self.timeline_table.setModel(self.timeline_model)
+        self.timeline_table.horizontalHeader().setResizeContentsPrecision(100)
         self.timeline_table.setAlternatingRowColors(True)
         self.timeline_table.setSortingEnabled(True)
-        self.timeline_table.cellDoubleClicked.connect(self.on_timeline_clicked)
+        self.timeline_table.doubleClicked.connect(self.on_timeline_clicked)
 
         header = self.timeline_table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
@@ -685,23 +1188,17 @@ class InteractiveNetworkViewer(QMainWindow):
 
     def create_advanced_table_tab(self):
         """Advanced table view"""
-        table_tab = QWidget()
-        layout = QVBoxLayout(table_tab)
-        layout.setContentsMargins(15, 15, 15, 15)
-
-        header = QLabel("📋 Advanced Connection Table")
-        header.setStyleSheet("font-size: 20px; font-weight: bold; color: #34495e; margin-bottom: 10px;")
-        layout.addWidget(header)
+        table_tab, layout = self._make_tab("📋 Advanced Connection Table", "#34495e")
 
         # Filters
         filter_frame = QFrame()
-        filter_frame.setStyleSheet("background-color: white; border-radius: 8px; padding: 10px;")
+        filter_frame.setObjectName("filterFrame")
         filter_layout = QHBoxLayout(filter_frame)
 
         filter_layout.addWidget(QLabel("🔍"))
         self.table_search = QLineEdit()
         self.table_search.setPlaceholderText("Search...")
-        self.table_search.textChanged.connect(self.apply_table_filters)
+        self.table_search.textChanged.connect(lambda _text: self._table_search_timer.start())
         filter_layout.addWidget(self.table_search, 3)
 
         self.table_protocol = QComboBox()
@@ -727,22 +1224,74 @@ class InteractiveNetworkViewer(QMainWindow):
 
         # Count
         self.table_count = QLabel("Results: 0")
-        self.table_count.setStyleSheet("font-weight: bold; margin: 5px;")
+        self.table_count.setObjectName("countLabel")
         layout.addWidget(self.table_count)
 
         # Table
-        self.advanced_table = QTableWidget()
-        self.advanced_table.setColumnCount(15)
-        self.advanced_table.setHorizontalHeaderLabels([
-            'PID', 'Process', 'Protocol', 'Status', 'Local Addr', 'L.Port',
-            'Remote Addr', 'R.Port', 'Username', 'Start Time', 'Uptime',
-            'Parent Chain', 'Trusted', 'Conn.Time', 'PPID'
-        ])
+        def net_proc(net):
+            return self.process_map.get(net['_pid_str'], {})
+
+        def net_start(net):
+            proc = net_proc(net)
+            return proc.get('StartTime', '')[:19].replace('T', ' ') if proc.get('StartTime') else 'N/A'
+
+        def net_chain(net):
+            chain = net_proc(net).get('CallChain', '')
+            if chain:
+                parts = chain.split(' -> ')
+                if len(parts) > 3:
+                    chain = '...' + ' -> '.join(parts[-3:])
+            return chain
+
+        def net_trusted(net):
+            auth = net.get('Authenticode')
+            return '✓' if auth and auth.get('Trusted') == 'trusted' else '✗'
+
+        def net_background(net, col):
+            if col == 3:
+                if net.get('Status') == 'ESTAB':
+                    return QColor(144, 238, 144)
+                if net.get('Status') == 'LISTEN':
+                    return QColor(173, 216, 230)
+            return None
+
+        def net_foreground(net, col):
+            if col == 12:
+                return QColor("#27ae60") if net_trusted(net) == '✓' else QColor("#e74c3c")
+            return None
+
+        self.advanced_table = QTableView()
+        self.advanced_model = DictTableModel(
+            ['PID', 'Process', 'Protocol', 'Status', 'Local Addr', 'L.Port',
+             'Remote Addr', 'R.Port', 'Username', 'Start Time', 'Uptime',
+             'Parent Chain', 'Trusted', 'Conn.Time', 'PPID'],
+            [
+                lambda n: n['_pid_str'],
+                lambda n: n.get('Name', ''),
+                lambda n: n.get('Type', ''),
+                lambda n: n.get('Status', ''),
+                lambda n: n.get('Laddr', ''),
+                lambda n: n.get('Lport', 0),
+                lambda n: n.get('Raddr', ''),
+                lambda n: n.get('Rport', 0),
+                lambda n: net_proc(n).get('Username', n.get('Username', '')),
+                net_start,
+                lambda n: self.calculate_uptime(net_proc(n).get('StartTime', ''), self._now_epoch),
+                net_chain,
+                net_trusted,
+                lambda n: n.get('Timestamp', '')[:19].replace('T', ' ') if n.get('Timestamp') else '',
+                lambda n: net_proc(n).get('_ppid_str', ''),
+            ],
+            background=net_background,
+            foreground=net_foreground
+        )
+        self.advanced_table.setModel(self.advanced_model)
+        self.advanced_table.horizontalHeader().setResizeContentsPrecision(100)
 
         self.advanced_table.setAlternatingRowColors(True)
         self.advanced_table.setSortingEnabled(True)
-        self.advanced_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.advanced_table.cellDoubleClicked.connect(self.on_table_double_clicked)
+        self.advanced_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.advanced_table.doubleClicked.connect(self.on_table_double_clicked)
 
         header = self.advanced_table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
@@ -753,80 +1302,50 @@ class InteractiveNetworkViewer(QMainWindow):
         self.tabs.addTab(table_tab, "📋 Table View")
 
     def load_data(self):
-        """Load data from all JSON files in the directory and auto-detect their type."""
-        self.network_data = []
-        self.process_data = []
-        self.process_map = {}
-
-        # Use glob to find all .json files in the current directory
-        json_files = glob.glob('*.json')
-
-        for file_path in json_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    # Read the first line to detect file type
-                    first_line = f.readline()
-                    if not first_line.strip():
-                        continue
-                    
-                    try:
-                        first_obj = json.loads(first_line)
-                    except json.JSONDecodeError:
-                        print(f"Warning: Could not decode first line of {file_path}. Skipping.")
-                        continue
-
-                    if not isinstance(first_obj, dict):
-                        print(f"Warning: First line of {file_path} is not a JSON object. Skipping.")
-                        continue
-
-                    # Rewind to process the whole file
-                    f.seek(0)
-
-                    # Detect file type based on keys in the first object
-                    if 'Laddr' in first_obj and 'Raddr' in first_obj:  # Likely network data
-                        print(f"Processing {file_path} as network data...")
-                        for line in f:
-                            line = line.strip()
-                            if line:
-                                try:
-                                    obj = json.loads(line)
-                                    if isinstance(obj, dict):
-                                        self.network_data.append(obj)
-                                except json.JSONDecodeError:
-                                    continue
-                    elif 'Ppid' in first_obj and 'CommandLine' in first_obj:  # Likely process data
-                        print(f"Processing {file_path} as process data...")
-                        for line in f:
-                            line = line.strip()
-                            if line:
-                                try:
-                                    obj = json.loads(line)
-                                    if isinstance(obj, dict):
-                                        self.process_data.append(obj)
-                                        self.process_map[str(obj.get('Pid', ''))] = obj
-                                except json.JSONDecodeError:
-                                    continue
-                    else:
-                        print(f"Warning: Could not determine data type for {file_path}. Skipping.")
-
-            except Exception as e:
-                QMessageBox.warning(self, "File Load Error", f"Error processing file {file_path}:\n{e}")
-
-        # Brute-force removal of any None or non-dictionary values that might have slipped through
-        self.network_data = [item for item in self.network_data if isinstance(item, dict)]
-        self.process_data = [item for item in self.process_data if isinstance(item, dict)]
+        """Kick off background parsing of all JSON files in the directory.
+
+        The window paints immediately; _on_data_loaded populates the views
+        once the pool thread has parsed everything.
+        """
+        # os.scandir returns name and stat info in one directory pass (no
+        # fnmatch, no extra stat per entry); largest files go first so the
+        # parallel parse finishes with the shortest makespan
+        entries = [e for e in os.scandir('.') if e.is_file() and e.name.endswith('.json')]
+        entries.sort(key=lambda e: e.stat().st_size, reverse=True)
+        json_files = [e.path for e in entries]
+        self.statusBar().showMessage(f"Loading {len(json_files)} JSON file(s)...")
+
+        self._loader = LoaderWorker(json_files)
+        self._loader.signals.done.connect(self._on_data_loaded)
+        QThreadPool.globalInstance().start(self._loader)
+
+    def _on_data_loaded(self, payload):
+        """Apply the loader's prepared dataset to the UI (main thread only)"""
+        for file_path, message in payload['errors']:
+            QMessageBox.warning(self, "File Load Error", f"Error processing file {file_path}:\n{message}")
+
+        # Rows, indexes and aggregates were all prepared on the loader
+        # thread; only the widget population below runs here
+        self.network_data = payload['network_data']
+        self.process_data = payload['process_data']
+        self.process_map = payload['process_map']
+        self.conns_by_pid = payload['conns_by_pid']
+        self.pid_status_counts = payload['pid_status_counts']
+        self._search_trigrams = None
+        self._stats = payload['stats']
+        self._forest_cache = None
 
         try:
             self.filtered_data = self.network_data.copy()
 
-            # Populate filters
-            if self.network_data:
-                statuses = sorted(set(item.get('Status', '') for item in self.network_data if item.get('Status')))
+            # Populate filters from the stats pass — one addItems call each
+            statuses = sorted(self._stats['by_status'])
+            if statuses:
                 self.grid_status.addItems(statuses)
                 self.table_status.addItems(statuses)
 
-            if self.process_data:
-                users = sorted(set(p.get('Username', '') for p in self.process_data if p.get('Username')))
+            users = sorted(self._stats['by_user'])
+            if users:
                 self.table_user.addItems(users)
 
             # Populate all views
@@ -838,6 +1357,8 @@ class InteractiveNetworkViewer(QMainWindow):
             self.populate_timeline()
             self.populate_advanced_table()
 
+            self.statusBar().showMessage("Ready | Click on any metric, process, or connection to navigate")
+
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to populate views with loaded data: {e}")
 
@@ -847,20 +1368,16 @@ class InteractiveNetworkViewer(QMainWindow):
         for i in reversed(range(self.metrics_layout.count())):
             self.metrics_layout.itemAt(i).widget().setParent(None)
 
-        # Calculate metrics
+        # Metrics come from _compute_stats, run once in _prepare_dataset
+        stats = self._stats
         total_conns = len(self.network_data)
         total_procs = len(self.process_data)
-        tcp_count = sum(1 for n in self.network_data if n.get('Type') == 'TCP')
-        udp_count = sum(1 for n in self.network_data if n.get('Type') == 'UDP')
-        listening = sum(1 for n in self.network_data if n.get('Status') == 'LISTEN')
-        established = sum(1 for n in self.network_data if n.get('Status') == 'ESTAB')
-
-        external = sum(1 for n in self.network_data
-                      if n.get('Status') == 'ESTAB' and n.get('Raddr', '').strip()
-                      and not n.get('Raddr', '').startswith('127.')
-                      and not n.get('Raddr', '').startswith('::1'))
-
-        procs_with_net = len(set(str(n.get('Pid')) for n in self.network_data))
+        tcp_count = stats['by_proto'].get('TCP', 0)
+        udp_count = stats['by_proto'].get('UDP', 0)
+        listening = stats['by_status'].get('LISTEN', 0)
+        established = stats['by_status'].get('ESTAB', 0)
+        external = stats['external']
+        procs_with_net = len(stats['pids_with_net'])
 
         # Create clickable metric cards
         class CardWithAction(ClickableMetricCard):
@@ -886,8 +1403,7 @@ class InteractiveNetworkViewer(QMainWindow):
         self.metrics_layout.addWidget(self.estab_card, 0, 3)
 
         # Unsigned/untrusted
-        unsigned = sum(1 for n in self.network_data
-                      if not n.get('Authenticode') or n.get('Authenticode', {}).get('Trusted') != 'trusted')
+        unsigned = stats['unsigned']
 
         def goto_security():
             self.tabs.setCurrentIndex(3)
@@ -897,8 +1413,7 @@ class InteractiveNetworkViewer(QMainWindow):
         self.metrics_layout.addWidget(self.unsigned_card, 1, 0, 1, 2)
 
         # External IPs
-        remote_ips = set(n.get('Raddr') for n in self.network_data
-                        if n.get('Raddr') and n.get('Raddr') not in ['', '0.0.0.0', '::'])
+        remote_ips = stats['remote_ips']
 
         def goto_external():
             self.tabs.setCurrentIndex(3)
@@ -908,15 +1423,16 @@ class InteractiveNetworkViewer(QMainWindow):
         self.metrics_layout.addWidget(self.remote_card, 1, 2, 1, 2)
 
         # Activity feed
-        self.activity_list.clear()
-        recent = sorted(self.network_data, key=lambda x: x.get('Timestamp', ''), reverse=True)[:15]
-        for conn in recent:
-            status = conn.get('Status', '')
-            icon = "🟢" if status == 'ESTAB' else "🔵" if status == 'LISTEN' else "⚪"
-            text = f"{icon} {conn.get('Name')} ({conn.get('Pid')}) - {conn.get('Type')} {status}"
-            item = QListWidgetItem(text)
-            item.setData(Qt.ItemDataRole.UserRole, conn)
-            self.activity_list.addItem(item)
+        recent = heapq.nlargest(15, self.network_data, key=lambda x: x.get('Timestamp', ''))
+        with bulk_update(self.activity_list):
+            self.activity_list.clear()
+            for conn in recent:
+                status = conn.get('Status', '')
+                icon = "🟢" if status == 'ESTAB' else "🔵" if status == 'LISTEN' else "⚪"
+                text = f"{icon} {conn.get('Name')} ({conn.get('Pid')}) - {conn.get('Type')} {status}"
+                item = QListWidgetItem(text)
+                item.setData(Qt.ItemDataRole.UserRole, conn)
+                self.activity_list.addItem(item)
 
         # Charts
         if CHARTS_AVAILABLE:
@@ -939,11 +1455,7 @@ class InteractiveNetworkViewer(QMainWindow):
         self.dashboard_chart1.setChart(chart)
 
         # Bar chart
-        proc_counts = defaultdict(int)
-        for n in self.network_data:
-            proc_counts[n.get('Name', 'Unknown')] += 1
-
-        top_10 = sorted(proc_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        top_10 = self._stats['by_name'].most_common(10)
 
         set0 = QBarSet('Connections')
         set0.setColor(QColor("#9b59b6"))
@@ -973,101 +1485,224 @@ class InteractiveNetworkViewer(QMainWindow):
 
         self.dashboard_chart2.setChart(chart)
 
+    GRID_COLS = 3
+    GRID_CARD_HEIGHT = 140
+    GRID_SPACING = 10
+
+    def _build_search_trigrams(self):
+        """Inverted trigram index over the search keys, built on demand.
+
+        Postings are ascending array('I') row indexes - a few bytes per
+        entry rather than a set of boxed ints - and the build is deferred
+        to the first query that can use it, so loads where the user never
+        searches pay neither the time nor the memory.
+        """
+        index = {}
+        for idx, n in enumerate(self.network_data):
+            key = n['_search_key']
+            for i in range(len(key) - 2):
+                arr = index.setdefault(key[i:i + 3], array('I'))
+                if not arr or arr[-1] != idx:
+                    arr.append(idx)
+        self._search_trigrams = index
+
+    def _search_pool(self, query):
+        """Rows worth scanning for a query: trigram candidates when possible.
+
+        For a single token of three or more characters, intersect the
+        token's trigram postings and return just those rows (in dataset
+        order); the caller still verifies the full substring. Everything
+        else falls back to the whole dataset.
+        """
+        query = query.strip()
+        if not query or ' ' in query or len(query) < 3:
+            return self.network_data
+        if self._search_trigrams is None:
+            self._build_search_trigrams()
+
+        postings = []
+        for i in range(len(query) - 2):
+            hits = self._search_trigrams.get(query[i:i + 3])
+            if not hits:
+                return ()
+            postings.append(hits)
+
+        # Intersect smallest-first so the candidate set only shrinks
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for hits in postings[1:]:
+            candidates.intersection_update(hits)
+            if not candidates:
+                return ()
+        nd = self.network_data
+        return [nd[i] for i in sorted(candidates)]
+
     def populate_network_grid(self):
         """Populate network grid"""
-        for i in reversed(range(self.grid_layout.count())):
-            self.grid_layout.itemAt(i).widget().setParent(None)
-
-        search = self.grid_search.text().lower()
+        query = self.grid_search.text().lower()
+        match = _search_matcher(query)
         protocol = self.grid_protocol.currentText()
         status = self.grid_status.currentText()
 
         filtered = []
-        for net in self.network_data:
+        for net in self._search_pool(query):
             if protocol != 'All' and net.get('Type') != protocol:
                 continue
             if status != 'All' and net.get('Status') != status:
                 continue
-            if search:
-                searchable = f"{net.get('Name', '')} {net.get('Pid', '')} {net.get('Laddr', '')} {net.get('Raddr', '')}".lower()
-                if search not in searchable:
-                    continue
+            if match and not match(net['_search_key']):
+                continue
             filtered.append(net)
 
-        cols = 3
-        for idx, conn in enumerate(filtered[:50]):
-            pid = str(conn.get('Pid', ''))
-            proc_info = self.process_map.get(pid, {})
-            card = ClickableConnectionCard(conn, proc_info)
-            card.clicked.connect(self.on_card_clicked)
-            row = idx // cols
-            col = idx % cols
-            self.grid_layout.addWidget(card, row, col)
-
-        self.grid_count_label.setText(f"Showing {min(len(filtered), 50)} of {len(filtered)} connections")
-
-    def populate_process_intel(self):
-        """Populate process intel tree"""
-        self.intel_tree.clear()
-
-        children_map = defaultdict(list)
-        all_pids = set(str(p.get('Pid', '')) for p in self.process_data)
-
-        for proc in self.process_data:
-            ppid = str(proc.get('Ppid', ''))
-            if ppid:
-                children_map[ppid].append(proc)
-
-        root_procs = [p for p in self.process_data
-                     if str(p.get('Ppid', '')) not in all_pids or not p.get('Ppid')]
-
-        def add_node(parent, proc):
-            pid = str(proc.get('Pid', ''))
-            conns = [n for n in self.network_data if str(n.get('Pid')) == pid]
-            start = proc.get('StartTime', '')[:19].replace('T', ' ') if proc.get('StartTime') else ''
-
-            item = QTreeWidgetItem([
-                proc.get('Name', ''),
-                pid,
-                proc.get('Username', ''),
-                str(len(conns)),
-                start
-            ])
-            item.setData(0, Qt.ItemDataRole.UserRole, proc)
-
-            if len(conns) > 0:
-                item.setBackground(0, QColor(255, 244, 179))
-
-            if parent:
-                parent.addChild(item)
+        self._grid_rows = filtered
+        self.grid_scroll.verticalScrollBar().setValue(0)
+        self._layout_visible_cards()
+
+        self.grid_count_label.setText(f"Showing {len(filtered)} connections")
+
+    def _layout_visible_cards(self):
+        """Create/reuse cards only for the rows inside the visible viewport"""
+        cols = self.GRID_COLS
+        spacing = self.GRID_SPACING
+        row_height = self.GRID_CARD_HEIGHT + spacing
+
+        viewport = self.grid_scroll.viewport()
+        width = max(viewport.width(), cols * 150)
+        card_width = (width - (cols + 1) * spacing) // cols
+
+        total = len(self._grid_rows)
+        total_rows = (total + cols - 1) // cols
+        self.grid_container.resize(width, total_rows * row_height + spacing)
+
+        # Visible index range (one extra row of slack on each side)
+        top = self.grid_scroll.verticalScrollBar().value()
+        first_row = max(0, top // row_height - 1)
+        last_row = (top + viewport.height()) // row_height + 1
+        first_idx = first_row * cols
+        last_idx = min(total, (last_row + 1) * cols)
+
+        pool = self._grid_card_pool
+        used = 0
+        for idx in range(first_idx, last_idx):
+            conn = self._grid_rows[idx]
+            proc_info = self.process_map.get(conn['_pid_str'], {})
+
+            if used < len(pool):
+                card = pool[used]
+                card.update_connection(conn, proc_info)
             else:
-                self.intel_tree.addTopLevelItem(item)
-
-            for child in children_map.get(pid, []):
-                add_node(item, child)
+                card = ClickableConnectionCard(conn, proc_info, self.grid_container)
+                card.clicked.connect(self.on_card_clicked)
+                pool.append(card)
+
+            row, col = divmod(idx, cols)
+            card.setGeometry(
+                spacing + col * (card_width + spacing),
+                spacing + row * row_height,
+                card_width,
+                self.GRID_CARD_HEIGHT
+            )
+            card.show()
+            used += 1
+
+        for card in pool[used:]:
+            card.hide()
+
+    def _forest_state(self):
+        """Children map and roots of the process forest, built once per load.
+
+        Both tree views traverse the same parent/child structure; cache it
+        here and drop the cache whenever process_data is replaced.
+        """
+        if self._forest_cache is None:
+            children_map = defaultdict(list)
+            all_pids = {p['_pid_str'] for p in self.process_data}
+
+            for proc in self.process_data:
+                ppid = proc['_ppid_str']
+                if ppid:
+                    children_map[ppid].append(proc)
+
+            root_procs = [p for p in self.process_data
+                         if p['_ppid_str'] not in all_pids or not p.get('Ppid')]
+            self._forest_cache = (children_map, root_procs)
+        return self._forest_cache
 
-        for proc in root_procs:
-            add_node(None, proc)
-
-        self.intel_tree.expandAll()
+    def populate_process_intel(self):
+        """Populate the intel tree roots; children materialize on expand"""
+        children_map, root_procs = self._forest_state()
+        self._intel_pid_index.clear()
+        with bulk_update(self.intel_tree):
+            self.intel_tree.clear()
+            self.intel_tree.addTopLevelItems(
+                [self._intel_item(proc, children_map) for proc in root_procs])
+
+    def _intel_item(self, proc, children_map):
+        """Build one intel-tree row, deferring its children behind a stub"""
+        pid = proc['_pid_str']
+        conns = self.conns_by_pid.get(pid, ())
+        start = proc.get('StartTime', '')[:19].replace('T', ' ') if proc.get('StartTime') else ''
+
+        item = QTreeWidgetItem([
+            proc.get('Name', ''),
+            pid,
+            proc.get('Username', ''),
+            str(len(conns)),
+            start
+        ])
+        item.setData(0, Qt.ItemDataRole.UserRole, proc)
+        self._intel_pid_index[pid] = item
+
+        if len(conns) > 0:
+            item.setBackground(0, QColor(255, 244, 179))
+
+        children = children_map.get(pid)
+        if children:
+            # Placeholder keeps the expand arrow without building the
+            # subtree; _materialize_children swaps in the real rows
+            item.addChild(QTreeWidgetItem(['...']))
+            item.setData(0, Qt.ItemDataRole.UserRole + 1, children)
+        return item
+
+    def _materialize_children(self, item):
+        """Replace a node's placeholder with its real child rows"""
+        pending = item.data(0, Qt.ItemDataRole.UserRole + 1)
+        if not pending:
+            return
+        item.setData(0, Qt.ItemDataRole.UserRole + 1, None)
+        children_map, _ = self._forest_state()
+        with bulk_update(self.intel_tree):
+            item.takeChildren()
+            item.addChildren(
+                [self._intel_item(child, children_map) for child in pending])
 
     def populate_security_analysis(self):
         """Populate security tab"""
         for i in reversed(range(self.security_metrics_layout.count())):
             self.security_metrics_layout.itemAt(i).widget().setParent(None)
 
-        unsigned = [n for n in self.network_data
-                   if not n.get('Authenticode') or n.get('Authenticode', {}).get('Trusted') != 'trusted']
+        # One walk collecting all three row lists at once
+        unsigned = []
+        external = []
+        high_ports = []
+        for n in self.network_data:
+            auth = n.get('Authenticode')
+            if not auth or auth.get('Trusted') != 'trusted':
+                unsigned.append(n)
+
+            raddr = n.get('Raddr', '')
+            if (n.get('Status') == 'ESTAB' and raddr.strip()
+                    and not raddr.startswith(_LOOPBACK_PREFIXES)):
+                external.append(n)
 
-        external = [n for n in self.network_data
-                   if n.get('Status') == 'ESTAB' and n.get('Raddr', '').strip()
-                   and not n.get('Raddr', '').startswith('127.')
-                   and not n.get('Raddr', '').startswith('::1')]
+            if n.get('Lport', 0) > 49152:
+                high_ports.append(n)
 
-        high_ports = [n for n in self.network_data if n.get('Lport', 0) > 49152]
+        # One count per unique name, shared by the card and the threat list
+        unsigned_counts = Counter(n.get('Name') for n in unsigned)
 
         cards = [
-            ("Unsigned", len(set(n.get('Name') for n in unsigned)), "processes", "#e74c3c"),
+            ("Unsigned", len(unsigned_counts), "processes", "#e74c3c"),
             ("External", len(external), "connections", "#f39c12"),
             ("High Ports", len(high_ports), "> 49152", "#95a5a6"),
         ]
@@ -1077,120 +1712,67 @@ class InteractiveNetworkViewer(QMainWindow):
             self.security_metrics_layout.addWidget(card)
 
         # Threat list
-        self.threat_list.clear()
-        if unsigned:
-            for proc_name in sorted(set(n.get('Name') for n in unsigned)):
-                count = sum(1 for n in unsigned if n.get('Name') == proc_name)
-                item = QListWidgetItem(f"🔴 {proc_name} ({count} unsigned connections)")
+        with bulk_update(self.threat_list):
+            self.threat_list.clear()
+            for proc_name in sorted(unsigned_counts):
+                item = QListWidgetItem(f"🔴 {proc_name} ({unsigned_counts[proc_name]} unsigned connections)")
                 item.setData(Qt.ItemDataRole.UserRole, proc_name)
                 self.threat_list.addItem(item)
 
         # External table
-        self.external_table.setRowCount(len(external))
-        for row, conn in enumerate(external):
-            pid = str(conn.get('Pid', ''))
-            proc = self.process_map.get(pid, {})
-
-            self.external_table.setItem(row, 0, QTableWidgetItem(conn.get('Name', '')))
-            self.external_table.setItem(row, 1, QTableWidgetItem(pid))
-            self.external_table.setItem(row, 2, QTableWidgetItem(conn.get('Raddr', '')))
-
-            port_item = QTableWidgetItem(str(conn.get('Rport', '')))
-            port_item.setData(Qt.ItemDataRole.UserRole, conn)
-            self.external_table.setItem(row, 3, port_item)
-
-            self.external_table.setItem(row, 4, QTableWidgetItem(conn.get('Type', '')))
-            self.external_table.setItem(row, 5, QTableWidgetItem(proc.get('Username', '')))
-
+        self.external_model.set_rows(external)
         self.external_table.resizeColumnsToContents()
 
     def populate_process_tree(self):
         """Populate interactive tree"""
-        self.process_tree.clear()
-
-        children_map = defaultdict(list)
-        all_pids = set(str(p.get('Pid', '')) for p in self.process_data)
-
-        for proc in self.process_data:
-            ppid = str(proc.get('Ppid', ''))
-            if ppid:
-                children_map[ppid].append(proc)
-
-        root_procs = [p for p in self.process_data
-                     if str(p.get('Ppid', '')) not in all_pids or not p.get('Ppid')]
-
-        def add_node(parent, proc):
-            pid = str(proc.get('Pid', ''))
-            conns = [n for n in self.network_data if str(n.get('Pid')) == pid]
-            start = proc.get('StartTime', '')[:19].replace('T', ' ') if proc.get('StartTime') else ''
-
-            sample_conn = next((n for n in conns), None)
-            auth_info = sample_conn.get('Authenticode') if sample_conn else None
-            trusted = "✓" if auth_info and auth_info.get('Trusted') == 'trusted' else "✗"
-
-            item = QTreeWidgetItem([
-                f"{proc.get('Name', '')} ({pid})",
-                proc.get('Username', ''),
-                str(len(conns)),
-                start,
-                trusted
-            ])
-            item.setData(0, Qt.ItemDataRole.UserRole, proc)
-
-            if len(conns) > 0:
-                item.setForeground(0, QBrush(QColor("#f39c12")))
-                item.setBackground(0, QColor(255, 250, 230))
-
-            if trusted == "✓":
-                item.setForeground(4, QBrush(QColor("#27ae60")))
-            else:
-                item.setForeground(4, QBrush(QColor("#e74c3c")))
-
-            if parent:
-                parent.addChild(item)
-            else:
-                self.process_tree.addTopLevelItem(item)
-
-            for child in children_map.get(pid, []):
-                add_node(item, child)
-
-        for proc in root_procs:
-            add_node(None, proc)
-
-        self.process_tree.expandToDepth(1)
+        children_map, root_procs = self._forest_state()
+
+        # Iterative BFS over the forest, appending standard-item rows;
+        # the proxy on top handles filtering without touching this build
+        model = self.process_tree_model
+        model.removeRows(0, model.rowCount())
+        root = model.invisibleRootItem()
+
+        with bulk_update(self.process_tree):
+            worklist = deque((root, proc) for proc in root_procs)
+            while worklist:
+                parent, proc = worklist.popleft()
+                pid = proc['_pid_str']
+                conns = self.conns_by_pid.get(pid, ())
+                start = proc.get('StartTime', '')[:19].replace('T', ' ') if proc.get('StartTime') else ''
+
+                sample_conn = next((n for n in conns), None)
+                auth_info = sample_conn.get('Authenticode') if sample_conn else None
+                trusted = "✓" if auth_info and auth_info.get('Trusted') == 'trusted' else "✗"
+
+                name_item = QStandardItem(f"{proc.get('Name', '')} ({pid})")
+                name_item.setData(proc, Qt.ItemDataRole.UserRole)
+
+                if len(conns) > 0:
+                    name_item.setForeground(QBrush(QColor("#f39c12")))
+                    name_item.setBackground(QBrush(QColor(255, 250, 230)))
+
+                status_item = QStandardItem(trusted)
+                if trusted == "✓":
+                    status_item.setForeground(QBrush(QColor("#27ae60")))
+                else:
+                    status_item.setForeground(QBrush(QColor("#e74c3c")))
+
+                parent.appendRow([
+                    name_item,
+                    QStandardItem(proc.get('Username', '')),
+                    QStandardItem(str(len(conns))),
+                    QStandardItem(start),
+                    status_item
+                ])
+
+                worklist.extend((name_item, child) for child in children_map.get(pid, ()))
+            self.process_tree.expandToDepth(1)
 
     def populate_timeline(self):
         """Populate timeline"""
         sorted_procs = sorted(self.process_data, key=lambda x: x.get('StartTime', ''), reverse=True)
-
-        self.timeline_table.setRowCount(len(sorted_procs))
-
-        for row, proc in enumerate(sorted_procs):
-            pid = str(proc.get('Pid', ''))
-            conns = [n for n in self.network_data if str(n.get('Pid')) == pid]
-            listening = sum(1 for c in conns if c.get('Status') == 'LISTEN')
-            established = sum(1 for c in conns if c.get('Status') == 'ESTAB')
-
-            start = proc.get('StartTime', '')[:19].replace('T', ' ') if proc.get('StartTime') else ''
-
-            time_item = QTableWidgetItem(start)
-            time_item.setData(Qt.ItemDataRole.UserRole, proc)
-            self.timeline_table.setItem(row, 0, time_item)
-
-            self.timeline_table.setItem(row, 1, QTableWidgetItem("🔷 Process Start"))
-            self.timeline_table.setItem(row, 2, QTableWidgetItem(proc.get('Name', '')))
-            self.timeline_table.setItem(row, 3, QTableWidgetItem(pid))
-            self.timeline_table.setItem(row, 4, QTableWidgetItem(proc.get('Username', '')))
-
-            conn_item = QTableWidgetItem(str(len(conns)))
-            if len(conns) > 0:
-                conn_item.setBackground(QColor(255, 244, 179))
-            self.timeline_table.setItem(row, 5, conn_item)
-
-            self.timeline_table.setItem(row, 6, QTableWidgetItem(str(listening)))
-            self.timeline_table.setItem(row, 7, QTableWidgetItem(str(established)))
-            self.timeline_table.setItem(row, 8, QTableWidgetItem(proc.get('CallChain', '')))
-
+        self.timeline_model.set_rows(sorted_procs)
         self.timeline_table.resizeColumnsToContents()
 
     def populate_advanced_table(self):
@@ -1200,71 +1782,9 @@ class InteractiveNetworkViewer(QMainWindow):
 
     def update_advanced_table(self):
         """Update advanced table"""
-        self.advanced_table.setSortingEnabled(False)
-        self.advanced_table.setRowCount(len(self.filtered_data))
-
-        for row, net in enumerate(self.filtered_data):
-            pid = str(net.get('Pid', ''))
-            proc = self.process_map.get(pid, {})
-
-            pid_item = QTableWidgetItem(pid)
-            pid_item.setData(Qt.ItemDataRole.UserRole, net)
-            self.advanced_table.setItem(row, 0, pid_item)
-
-            self.advanced_table.setItem(row, 1, QTableWidgetItem(net.get('Name', '')))
-            self.advanced_table.setItem(row, 2, QTableWidgetItem(net.get('Type', '')))
-
-            status_item = QTableWidgetItem(net.get('Status', ''))
-            if net.get('Status') == 'ESTAB':
-                status_item.setBackground(QColor(144, 238, 144))
-            elif net.get('Status') == 'LISTEN':
-                status_item.setBackground(QColor(173, 216, 230))
-            self.advanced_table.setItem(row, 3, status_item)
-
-            self.advanced_table.setItem(row, 4, QTableWidgetItem(net.get('Laddr', '')))
-
-            lport_item = QTableWidgetItem()
-            lport_item.setData(Qt.ItemDataRole.DisplayRole, net.get('Lport', 0))
-            self.advanced_table.setItem(row, 5, lport_item)
-
-            self.advanced_table.setItem(row, 6, QTableWidgetItem(net.get('Raddr', '')))
-
-            rport_item = QTableWidgetItem()
-            rport_item.setData(Qt.ItemDataRole.DisplayRole, net.get('Rport', 0))
-            self.advanced_table.setItem(row, 7, rport_item)
-
-            username = proc.get('Username', net.get('Username', ''))
-            self.advanced_table.setItem(row, 8, QTableWidgetItem(username))
-
-            start = proc.get('StartTime', '')[:19].replace('T', ' ') if proc.get('StartTime') else 'N/A'
-            self.advanced_table.setItem(row, 9, QTableWidgetItem(start))
-
-            uptime = self.calculate_uptime(proc.get('StartTime', ''))
-            self.advanced_table.setItem(row, 10, QTableWidgetItem(uptime))
-
-            chain = proc.get('CallChain', '')
-            if chain:
-                parts = chain.split(' -> ')
-                if len(parts) > 3:
-                    chain = '...' + ' -> '.join(parts[-3:])
-            self.advanced_table.setItem(row, 11, QTableWidgetItem(chain))
-
-            auth = net.get('Authenticode')
-            trusted_item = QTableWidgetItem()
-            if auth and auth.get('Trusted') == 'trusted':
-                trusted_item.setText('✓')
-                trusted_item.setForeground(QBrush(QColor("#27ae60")))
-            else:
-                trusted_item.setText('✗')
-                trusted_item.setForeground(QBrush(QColor("#e74c3c")))
-            self.advanced_table.setItem(row, 12, trusted_item)
-
-            conn_time = net.get('Timestamp', '')[:19].replace('T', ' ') if net.get('Timestamp') else ''
-            self.advanced_table.setItem(row, 13, QTableWidgetItem(conn_time))
-
-            self.advanced_table.setItem(row, 14, QTableWidgetItem(str(proc.get('Ppid', ''))))
-
-        self.advanced_table.setSortingEnabled(True)
+        # One wall-clock read per refresh; every uptime cell derives from it
+        self._now_epoch = time.time()
+        self.advanced_model.set_rows(self.filtered_data)
         self.table_count.setText(f"Results: {len(self.filtered_data)} / {len(self.network_data)}")
         self.advanced_table.resizeColumnsToContents()
 
@@ -1281,7 +1801,7 @@ class InteractiveNetworkViewer(QMainWindow):
 
     def on_connection_selected(self, conn_data):
         """Handle connection selection"""
-        pid = str(conn_data.get('Pid', ''))
+        pid = conn_data['_pid_str']
         proc = self.process_map.get(pid, {})
 
         # Show details in message box
@@ -1320,8 +1840,8 @@ Click OK to navigate to this process in the Process Tree
         if not proc:
             return
 
-        pid = str(proc.get('Pid', ''))
-        conns = [n for n in self.network_data if str(n.get('Pid')) == pid]
+        pid = proc['_pid_str']
+        conns = self.conns_by_pid.get(pid, ())
 
         details = []
         details.append("=" * 60)
@@ -1349,13 +1869,15 @@ Click OK to navigate to this process in the Process Tree
         """Navigate to process tree when double-clicked"""
         proc = item.data(0, Qt.ItemDataRole.UserRole)
         if proc:
-            pid = str(proc.get('Pid', ''))
+            pid = proc['_pid_str']
             self.signals.process_selected.emit(pid)
             self.tabs.setCurrentIndex(4)
 
-    def on_tree_double_clicked(self, item):
-        """Show process connections when tree item double-clicked"""
-        proc = item.data(0, Qt.ItemDataRole.UserRole)
+    def on_tree_double_clicked(self, index):
+        """Show process connections when tree row double-clicked"""
+        source = self.process_tree_proxy.mapToSource(index.siblingAtColumn(0))
+        item = self.process_tree_model.itemFromIndex(source)
+        proc = item.data(Qt.ItemDataRole.UserRole) if item else None
         if proc:
             proc_name = proc.get('Name', '')
             self.signals.filter_by_process.emit(proc_name)
@@ -1374,35 +1896,29 @@ Click OK to navigate to this process in the Process Tree
             self.signals.filter_by_process.emit(proc_name)
             self.tabs.setCurrentIndex(1)
 
-    def on_external_table_clicked(self, row, col):
+    def on_external_table_clicked(self, index):
         """Show external connection details"""
-        item = self.external_table.item(row, 3)
-        if item:
-            conn = item.data(Qt.ItemDataRole.UserRole)
-            if conn:
-                self.signals.connection_selected.emit(conn)
+        conn = self.external_model.row_data(index.row())
+        if conn:
+            self.signals.connection_selected.emit(conn)
 
-    def on_timeline_clicked(self, row, col):
+    def on_timeline_clicked(self, index):
         """Navigate from timeline"""
-        item = self.timeline_table.item(row, 0)
-        if item:
-            proc = item.data(Qt.ItemDataRole.UserRole)
-            if proc:
-                pid = str(proc.get('Pid', ''))
-                self.tabs.setCurrentIndex(2)
-                self.select_process_in_intel_tree(pid)
-                self.statusBar().showMessage(f"Viewing process PID: {pid}")
+        proc = self.timeline_model.row_data(index.row())
+        if proc:
+            pid = proc['_pid_str']
+            self.tabs.setCurrentIndex(2)
+            self.select_process_in_intel_tree(pid)
+            self.statusBar().showMessage(f"Viewing process PID: {pid}")
 
-    def on_table_double_clicked(self, row, col):
+    def on_table_double_clicked(self, index):
         """Navigate from table and select process"""
-        item = self.advanced_table.item(row, 0)
-        if item:
-            conn = item.data(Qt.ItemDataRole.UserRole)
-            if conn:
-                pid = str(conn.get('Pid', ''))
-                self.tabs.setCurrentIndex(2)  # Go to Process Intel tab
-                self.select_process_in_intel_tree(pid)
-                self.statusBar().showMessage(f"Viewing process PID: {pid}")
+        conn = self.advanced_model.row_data(index.row())
+        if conn:
+            pid = conn['_pid_str']
+            self.tabs.setCurrentIndex(2)  # Go to Process Intel tab
+            self.select_process_in_intel_tree(pid)
+            self.statusBar().showMessage(f"Viewing process PID: {pid}")
 
     def goto_tree_tab(self):
         """Navigate to Process Tree and highlight selected process"""
@@ -1411,7 +1927,7 @@ Click OK to navigate to this process in the Process Tree
         if selected:
             proc = selected[0].data(0, Qt.ItemDataRole.UserRole)
             if proc:
-                pid = str(proc.get('Pid', ''))
+                pid = proc['_pid_str']
                 proc_name = proc.get('Name', '')
 
                 # Navigate to tree tab
@@ -1433,7 +1949,7 @@ Click OK to navigate to this process in the Process Tree
             proc = selected[0].data(0, Qt.ItemDataRole.UserRole)
             if proc:
                 proc_name = proc.get('Name', '')
-                pid = str(proc.get('Pid', ''))
+                pid = proc['_pid_str']
 
                 # Navigate to table tab
                 self.tabs.setCurrentIndex(6)
@@ -1496,31 +2012,36 @@ Click OK to navigate to this process in the Process Tree
 
     def apply_table_filters(self):
         """Apply table filters"""
-        search = self.table_search.text().lower()
+        query = self.table_search.text().lower()
+        match = _search_matcher(query)
         protocol = self.table_protocol.currentText()
         status = self.table_status.currentText()
         user = self.table_user.currentText()
 
         self.filtered_data = []
 
-        for net in self.network_data:
-            pid = str(net.get('Pid', ''))
-            proc = self.process_map.get(pid, {})
+        # Bind loop invariants to locals: skips the attribute/global
+        # lookups per row in what is the hottest per-keystroke loop
+        pm_get = self.process_map.get
+        append = self.filtered_data.append
+        any_protocol = protocol == 'All Protocols'
+        any_status = status == 'All Status'
+        any_user = user == 'All Users'
 
-            if protocol != 'All Protocols' and net.get('Type') != protocol:
+        for net in self._search_pool(query):
+            if not any_protocol and net.get('Type') != protocol:
                 continue
-            if status != 'All Status' and net.get('Status') != status:
+            if not any_status and net.get('Status') != status:
                 continue
-            if user != 'All Users':
+            if not any_user:
+                proc = pm_get(net['_pid_str'], {})
                 net_user = proc.get('Username', net.get('Username', ''))
                 if net_user != user:
                     continue
-            if search:
-                searchable = f"{net.get('Name', '')} {pid} {net.get('Laddr', '')} {net.get('Raddr', '')}".lower()
-                if search not in searchable:
-                    continue
+            if match and not match(net['_search_key']):
+                continue
 
-            self.filtered_data.append(net)
+            append(net)
 
         self.update_advanced_table()
 
@@ -1531,81 +2052,82 @@ Click OK to navigate to this process in the Process Tree
         self.table_status.setCurrentIndex(0)
         self.table_user.setCurrentIndex(0)
 
-    def filter_tree(self):
-        """Filter process tree"""
-        search_text = self.tree_search.text().lower()
-
-        def filter_item(item):
-            show = False
-            if search_text in item.text(0).lower():
-                show = True
-
-            for i in range(item.childCount()):
-                child_show = filter_item(item.child(i))
-                show = show or child_show
-
-            item.setHidden(not show)
-            return show
-
+    def _apply_tree_filter(self):
+        """Push the debounced search text into the proxy filter"""
+        search_text = self.tree_search.text().strip()
+        if ' ' in search_text:
+            # Multi-word query: any token matches, as one compiled regex
+            pattern = '|'.join(QRegularExpression.escape(tok)
+                               for tok in search_text.split())
+            self.process_tree_proxy.setFilterRegularExpression(
+                QRegularExpression(pattern,
+                                   QRegularExpression.PatternOption.CaseInsensitiveOption))
+        else:
+            self.process_tree_proxy.setFilterFixedString(search_text)
         if search_text:
-            for i in range(self.process_tree.topLevelItemCount()):
-                filter_item(self.process_tree.topLevelItem(i))
             self.process_tree.expandAll()
         else:
-            for i in range(self.process_tree.topLevelItemCount()):
-                self.show_all_items(self.process_tree.topLevelItem(i))
             self.process_tree.collapseAll()
             self.process_tree.expandToDepth(1)
 
-    def show_all_items(self, item):
-        """Show all tree items"""
-        item.setHidden(False)
-        for i in range(item.childCount()):
-            self.show_all_items(item.child(i))
-
     def select_process_in_intel_tree(self, pid):
         """Find and select a process in the Process Intel tree."""
-        iterator = QTreeWidgetItemIterator(self.intel_tree)
-        while iterator.value():
-            item = iterator.value()
-            if item.text(1) == pid:
-                self.intel_tree.setCurrentItem(item)
-                self.intel_tree.scrollToItem(item, QAbstractItemView.ScrollHint.PositionAtCenter)
-                # Expand parents
-                parent = item.parent()
-                while parent:
-                    parent.setExpanded(True)
-                    parent = parent.parent()
-                
-                # Manually trigger the details update
-                self.on_intel_tree_clicked(item)
-
-                break
-            iterator += 1
-
-    def calculate_uptime(self, start_time_str):
-        """Calculate uptime"""
-        if not start_time_str or start_time_str == '0001-01-01T00:00:00Z':
+        item = self._intel_pid_index.get(pid)
+        if item is None:
+            # Not built yet: materialize the lazily-loaded ancestor path,
+            # which registers each level's rows in the index
+            chain = []
+            cursor = self.process_map.get(pid)
+            while cursor is not None and cursor['_pid_str'] not in chain:
+                chain.append(cursor['_pid_str'])
+                cursor = self.process_map.get(cursor['_ppid_str'])
+            for step in reversed(chain):
+                step_item = self._intel_pid_index.get(step)
+                if step_item is None:
+                    return
+                self._materialize_children(step_item)
+            item = self._intel_pid_index.get(pid)
+            if item is None:
+                return
+
+        self.intel_tree.setCurrentItem(item)
+        self.intel_tree.scrollToItem(item, QAbstractItemView.ScrollHint.PositionAtCenter)
+        # Expand the full ancestor chain; isExpanded keeps the walk to
+        # cheap reads for ancestors a previous selection already opened
+        parent = item.parent()
+        while parent:
+            if not parent.isExpanded():
+                parent.setExpanded(True)
+            parent = parent.parent()
+
+        # Manually trigger the details update
+        self.on_intel_tree_clicked(item)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def calculate_uptime(start_time_str, now_epoch):
+        """Calculate uptime against a per-refresh epoch (memoized)"""
+        # Cheap shape checks first so the exception path stays exceptional
+        if (not start_time_str or len(start_time_str) < 19
+                or start_time_str.startswith('0001')):
             return 'N/A'
 
         try:
-            start = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
-            now = datetime.now(start.tzinfo)
-            delta = now - start
-
-            days = delta.days
-            hours, remainder = divmod(delta.seconds, 3600)
-            minutes, _ = divmod(remainder, 60)
-
-            if days > 0:
-                return f'{days}d {hours}h'
-            elif hours > 0:
-                return f'{hours}h {minutes}m'
-            else:
-                return f'{minutes}m'
-        except:
+            start_epoch = datetime.fromisoformat(start_time_str.replace('Z', '+00:00')).timestamp()
+        except ValueError:
             return 'N/A'
 
+        days, remainder = divmod(int(now_epoch - start_epoch), 86400)
+        hours, remainder = divmod(remainder, 3600)
+        minutes = remainder // 60
+
+        if days > 0:
+            return f'{days}d {hours}h'
+        elif hours > 0:
+            return f'{hours}h {minutes}m'
+        else:
+            return f'{minutes}m'
+
 
 def main():
     app = QApplication(sys.argv)